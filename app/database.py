@@ -14,6 +14,7 @@ if settings.database_url.startswith('postgresql'):
     engine = create_engine(
         settings.database_url,
         pool_pre_ping=True,
+        pool_use_lifo=True,  # Reuse warm connections, let idle ones expire
         pool_recycle=3600,
         pool_size=10,
         max_overflow=20,
@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
 from datetime import datetime
+import asyncio
 import logging
 
 from services.decter_controller import decter_controller, DecterConfig, DecterStatus
@@ -128,7 +129,7 @@ async def decter_health():
 async def get_decter_status(current_user: User = Depends(get_current_active_user)):
     """Get comprehensive Decter 001 status"""
     try:
-        status = decter_controller.get_status()
+        status = await asyncio.to_thread(decter_controller.get_status)
         return JSONResponse(content=status)
     except Exception as e:
         logger.error(f"❌ Error getting Decter status: {e}")
@@ -139,7 +140,7 @@ async def get_decter_status(current_user: User = Depends(get_current_active_user
 async def get_decter_performance(current_user: User = Depends(get_current_active_user)):
     """Get Decter 001 performance summary"""
     try:
-        performance = decter_controller.get_performance_summary()
+        performance = await asyncio.to_thread(decter_controller.get_performance_summary)
         return JSONResponse(content=performance)
     except Exception as e:
         logger.error(f"❌ Error getting Decter performance: {e}")
@@ -151,7 +152,7 @@ async def get_decter_performance(current_user: User = Depends(get_current_active
 async def start_decter(current_user: User = Depends(get_current_active_user)):
     """Start Decter 001 bot"""
     try:
-        result = decter_controller.start()
+        result = await asyncio.to_thread(decter_controller.start)
         if result["success"]:
             logger.info(f"✅ Decter 001 started by user: {getattr(current_user, 'email', 'unknown')}")
             return JSONResponse(content=result)
@@ -170,7 +171,7 @@ async def start_decter(current_user: User = Depends(get_current_active_user)):
 async def stop_decter(current_user: User = Depends(get_current_active_user)):
     """Stop Decter 001 bot"""
     try:
-        result = decter_controller.stop()
+        result = await asyncio.to_thread(decter_controller.stop)
         if result["success"]:
             logger.info(f"✅ Decter 001 stopped by user: {getattr(current_user, 'email', 'unknown')}")
             return JSONResponse(content=result)
@@ -186,7 +187,7 @@ async def stop_decter(current_user: User = Depends(get_current_active_user)):
 async def restart_decter(current_user: User = Depends(get_current_active_user)):
     """Restart Decter 001 bot"""
     try:
-        result = decter_controller.restart()
+        result = await asyncio.to_thread(decter_controller.restart)
         if result["success"]:
             logger.info(f"✅ Decter 001 restarted by user: {getattr(current_user, 'email', 'unknown')}")
             return JSONResponse(content=result)
@@ -216,7 +217,7 @@ async def set_decter_config(
             max_win_amount=config.max_win_amount
         )
         
-        result = decter_controller.set_parameters(decter_config)
+        result = await asyncio.to_thread(decter_controller.set_parameters, decter_config)
         if result["success"]:
             logger.info(f"✅ Decter 001 config updated by user: {getattr(current_user, 'email', 'unknown')}")
             return JSONResponse(content=result)
@@ -232,7 +233,7 @@ async def set_decter_config(
 async def get_decter_config(current_user: User = Depends(get_current_active_user)):
     """Get current Decter 001 configuration"""
     try:
-        config = decter_controller._get_current_config()
+        config = await asyncio.to_thread(decter_controller._get_current_config)
         return JSONResponse(content=config or {})
     except Exception as e:
         logger.error(f"❌ Error getting Decter config: {e}")
@@ -247,7 +248,7 @@ async def get_decter_trades(
 ):
     """Get Decter 001 trade history"""
     try:
-        trades = decter_controller.get_trade_history(limit)
+        trades = await asyncio.to_thread(decter_controller.get_trade_history, limit)
         return JSONResponse(content={"trades": trades, "count": len(trades)})
     except Exception as e:
         logger.error(f"❌ Error getting Decter trades: {e}")
@@ -258,9 +259,9 @@ async def get_decter_trades(
 async def get_decter_stats(current_user: User = Depends(get_current_active_user)):
     """Get detailed Decter 001 statistics"""
     try:
-        stats = decter_controller.get_stats()
+        stats = await asyncio.to_thread(decter_controller.get_stats)
         if stats:
-            return JSONResponse(content=stats.__dict__)
+            return JSONResponse(content=stats.to_dict())
         else:
             return JSONResponse(content={})
     except Exception as e:
@@ -318,7 +319,7 @@ async def get_decter_logs(
 ):
     """Get recent Decter 001 logs"""
     try:
-        logs = decter_controller._get_recent_logs(lines)
+        logs = await asyncio.to_thread(decter_controller._get_recent_logs, lines)
         return JSONResponse(content={"logs": logs, "count": len(logs)})
     except Exception as e:
         logger.error(f"❌ Error getting Decter logs: {e}")
@@ -329,7 +330,7 @@ async def get_decter_logs(
 async def clear_decter_logs(current_user: User = Depends(get_current_active_user)):
     """Clear Decter 001 JSON log files"""
     try:
-        result = decter_controller.clear_json_logs()
+        result = await asyncio.to_thread(decter_controller.clear_json_logs)
         if result["success"]:
             logger.info(f"✅ Decter logs cleared by user: {getattr(current_user, 'email', 'unknown')}")
             return JSONResponse(content=result)
@@ -391,7 +392,8 @@ async def set_telegram_config(
 ):
     """Set Telegram bot configuration"""
     try:
-        result = decter_controller.set_telegram_config(
+        result = await asyncio.to_thread(
+            decter_controller.set_telegram_config,
             config_req.bot_token,
             config_req.group_id,
             config_req.topic_id
@@ -410,7 +412,7 @@ async def set_telegram_config(
 async def get_telegram_config(current_user: User = Depends(get_current_active_user)):
     """Get current Telegram configuration"""
     try:
-        config = decter_controller.get_telegram_config()
+        config = await asyncio.to_thread(decter_controller.get_telegram_config)
         # Mask bot token for security
         if 'telegram_bot_token' in config:
             config['telegram_bot_token'] = '***MASKED***'
@@ -436,7 +438,8 @@ async def send_telegram_notification(
                 "timestamp": datetime.now().isoformat()
             }
         
-        result = decter_controller.send_telegram_notification(
+        result = await asyncio.to_thread(
+            decter_controller.send_telegram_notification,
             notify_req.message,
             transaction_data
         )
@@ -455,7 +458,7 @@ async def send_telegram_notification(
 async def send_daily_summary(current_user: User = Depends(get_current_active_user)):
     """Send daily trading summary via Telegram"""
     try:
-        result = decter_controller.send_daily_summary()
+        result = await asyncio.to_thread(decter_controller.send_daily_summary)
         
         if result["success"]:
             logger.info(f"✅ Daily summary sent by user: {getattr(current_user, 'email', 'unknown')}")
@@ -503,7 +506,8 @@ async def set_deriv_config(
         if config_req.usdt_api_token: currency_tokens['USDT'] = config_req.usdt_api_token
         if config_req.usd_api_token: currency_tokens['USD'] = config_req.usd_api_token
         
-        result = decter_controller.set_deriv_config(
+        result = await asyncio.to_thread(
+            decter_controller.set_deriv_config,
             config_req.deriv_app_id,
             currency_tokens
         )
@@ -521,7 +525,7 @@ async def set_deriv_config(
 async def get_deriv_config(current_user: User = Depends(get_current_active_user)):
     """Get current Deriv configuration"""
     try:
-        config = decter_controller.get_deriv_config()
+        config = await asyncio.to_thread(decter_controller.get_deriv_config)
         return JSONResponse(content=config)
     except Exception as e:
         logger.error(f"❌ Error getting Deriv config: {e}")
@@ -565,7 +569,7 @@ async def set_engine_config(
     """Set engine behavior and risk parameters"""
     try:
         config_dict = config_req.dict(exclude_unset=True)
-        result = decter_controller.set_engine_config(config_dict)
+        result = await asyncio.to_thread(decter_controller.set_engine_config, config_dict)
         
         if result["success"]:
             logger.info(f"✅ Engine config updated by user: {getattr(current_user, 'email', 'unknown')}")
@@ -581,7 +585,7 @@ async def set_engine_config(
 async def get_engine_config(current_user: User = Depends(get_current_active_user)):
     """Get current engine configuration"""
     try:
-        config = decter_controller.get_engine_config()
+        config = await asyncio.to_thread(decter_controller.get_engine_config)
         return JSONResponse(content=config)
     except Exception as e:
         logger.error(f"❌ Error getting engine config: {e}")
@@ -592,7 +596,7 @@ async def get_engine_config(current_user: User = Depends(get_current_active_user
 async def get_engine_diagnostics(current_user: User = Depends(get_current_active_user)):
     """Get comprehensive engine diagnostics and state"""
     try:
-        diagnostics = decter_controller.get_engine_diagnostics()
+        diagnostics = await asyncio.to_thread(decter_controller.get_engine_diagnostics)
         return JSONResponse(content=diagnostics)
     except Exception as e:
         logger.error(f"❌ Error getting engine diagnostics: {e}")
@@ -606,7 +610,7 @@ async def switch_currency(
 ):
     """Switch active trading currency"""
     try:
-        result = decter_controller.switch_currency(switch_req.currency)
+        result = await asyncio.to_thread(decter_controller.switch_currency, switch_req.currency)
         
         if result["success"]:
             logger.info(f"✅ Currency switched by user: {getattr(current_user, 'email', 'unknown')} to {switch_req.currency}")
@@ -622,7 +626,7 @@ async def switch_currency(
 async def get_supported_currencies(current_user: User = Depends(get_current_active_user)):
     """Get list of supported currencies"""
     try:
-        engine_config = decter_controller.get_engine_config()
+        engine_config = await asyncio.to_thread(decter_controller.get_engine_config)
         currencies = engine_config.get("supported_currencies", ["XRP", "BTC", "ETH", "LTC", "USDT", "USD"])
         active_currency = engine_config.get("selected_currency", "XRP")
         
@@ -642,9 +646,9 @@ async def start_continuous_engine(current_user: User = Depends(get_current_activ
     """Start the continuous monitoring engine"""
     try:
         # Update engine config to enable continuous engine
-        config = decter_controller.get_engine_config()
+        config = await asyncio.to_thread(decter_controller.get_engine_config)
         config["enable_continuous_engine"] = True
-        result = decter_controller.set_engine_config(config)
+        result = await asyncio.to_thread(decter_controller.set_engine_config, config)
         
         if result["success"]:
             logger.info(f"✅ Continuous engine started by user: {getattr(current_user, 'email', 'unknown')}")
@@ -661,9 +665,9 @@ async def stop_continuous_engine(current_user: User = Depends(get_current_active
     """Stop the continuous monitoring engine"""
     try:
         # Update engine config to disable continuous engine
-        config = decter_controller.get_engine_config()
+        config = await asyncio.to_thread(decter_controller.get_engine_config)
         config["enable_continuous_engine"] = False
-        result = decter_controller.set_engine_config(config)
+        result = await asyncio.to_thread(decter_controller.set_engine_config, config)
         
         if result["success"]:
             logger.info(f"✅ Continuous engine stopped by user: {getattr(current_user, 'email', 'unknown')}")
@@ -680,9 +684,9 @@ async def start_decision_engine(current_user: User = Depends(get_current_active_
     """Start the decision/recovery engine"""
     try:
         # Update engine config to enable decision engine
-        config = decter_controller.get_engine_config()
+        config = await asyncio.to_thread(decter_controller.get_engine_config)
         config["enable_decision_engine"] = True
-        result = decter_controller.set_engine_config(config)
+        result = await asyncio.to_thread(decter_controller.set_engine_config, config)
         
         if result["success"]:
             logger.info(f"✅ Decision engine started by user: {getattr(current_user, 'email', 'unknown')}")
@@ -699,9 +703,9 @@ async def stop_decision_engine(current_user: User = Depends(get_current_active_u
     """Stop the decision/recovery engine"""
     try:
         # Update engine config to disable decision engine
-        config = decter_controller.get_engine_config()
+        config = await asyncio.to_thread(decter_controller.get_engine_config)
         config["enable_decision_engine"] = False
-        result = decter_controller.set_engine_config(config)
+        result = await asyncio.to_thread(decter_controller.set_engine_config, config)
         
         if result["success"]:
             logger.info(f"✅ Decision engine stopped by user: {getattr(current_user, 'email', 'unknown')}")
@@ -721,7 +725,8 @@ async def get_trade_history(
 ):
     """Get filtered trade history with pagination"""
     try:
-        result = decter_controller.get_filtered_trade_history(
+        result = await asyncio.to_thread(
+            decter_controller.get_filtered_trade_history,
             start_date=history_req.start_date,
             end_date=history_req.end_date,
             currency=history_req.currency,
@@ -748,7 +753,8 @@ async def get_trade_summary(
 ):
     """Get trade summary statistics"""
     try:
-        result = decter_controller.get_trade_summary_stats(
+        result = await asyncio.to_thread(
+            decter_controller.get_trade_summary_stats,
             start_date=start_date,
             end_date=end_date,
             currency=currency,
@@ -768,7 +774,8 @@ async def export_trades(
 ):
     """Export filtered trades to specified format"""
     try:
-        result = decter_controller.export_trade_history(
+        result = await asyncio.to_thread(
+            decter_controller.export_trade_history,
             export_format=export_req.format,
             start_date=export_req.start_date,
             end_date=export_req.end_date,
@@ -793,7 +800,7 @@ async def get_daily_breakdown(
 ):
     """Get daily trading performance breakdown"""
     try:
-        result = decter_controller.get_daily_trading_breakdown(days)
+        result = await asyncio.to_thread(decter_controller.get_daily_trading_breakdown, days)
         return JSONResponse(content=result)
     except Exception as e:
         logger.error(f"❌ Error getting daily breakdown: {e}")
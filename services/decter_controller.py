@@ -4,24 +4,189 @@ Provides unified control of Decter 001 trading bot from TARC Lighthouse platform
 """
 
 import asyncio
-import json
+import functools
 import logging
 import os
 import subprocess
 import sys
+import threading
 import time
-import traceback
 import signal
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from enum import Enum
+import orjson
 import psutil
 import requests
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Compact JSON codec for files read and written by the controller
+def _encode_json(data: Any) -> bytes:
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+_decode_json = orjson.loads
+
+# Read buffer for streaming the tail of plain-text log files
+_LOG_READ_BUFFER = 64 * 1024
+
+# Serializes read-modify-write of the controller's data files. Routes call
+# the controller from worker threads and every controller in the process
+# shares the same files, so this is module-level and re-entrant.
+_FILE_LOCK = threading.RLock()
+
+# NDJSON path -> appends since its last trim, shared by every controller
+# writing that file; guarded by _FILE_LOCK
+_NDJSON_APPENDS_SINCE_TRIM: Dict[Path, int] = {}
+
+
+def _with_file_lock(func):
+    """Run a controller method while holding _FILE_LOCK."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _FILE_LOCK:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _with_instance_lock(func):
+    """Run a controller method while holding the controller's own lock."""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+# Parsed JSON files keyed by path -> ((mtime_ns, size, inode), parsed, primed)
+_JSON_CACHE: Dict[Path, tuple] = {}
+
+# Files modified more recently than this are re-read unless the entry was
+# primed by our own write: a second in-place write within the same mtime
+# tick would not change the key
+_JSON_CACHE_RACY_NS = 1_000_000_000
+
+
+def _cached_json(path: Path, default: Any = None) -> Any:
+    """Load a JSON file, re-parsing only when its mtime, size or inode changed.
+
+    The inode catches atomic replaces that land within one mtime tick with
+    the same size (e.g. the Decter process rewriting trading_stats.json);
+    files touched within the last second are re-read unless the cached entry
+    came from our own write of that same inode.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _JSON_CACHE.pop(path, None)
+        return default
+
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _JSON_CACHE.get(path)
+    if (
+        cached is not None
+        and cached[0] == key
+        and (cached[2] or time.time_ns() - st.st_mtime_ns >= _JSON_CACHE_RACY_NS)
+    ):
+        return cached[1]
+
+    parsed = _decode_json(path.read_bytes())
+    _JSON_CACHE[path] = (key, parsed, False)
+    return parsed
+
+
+def _replace_json_file(path: Path, payload: bytes) -> None:
+    """Atomically replace path with already-encoded JSON bytes."""
+    # Unique per writer so readers never see a partial file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(payload)
+    st = tmp_path.stat()
+    os.replace(tmp_path, path)
+    _JSON_CACHE[path] = ((st.st_mtime_ns, st.st_size, st.st_ino), _decode_json(payload), True)
+
+
+def _write_json_atomic(path: Path, data: Any) -> bool:
+    """Write compact JSON via a temp file and os.replace.
+
+    Skips the write when the file already holds the same bytes. Returns True
+    if the file was rewritten. The cache is primed with a parse of the bytes
+    written, so later reads see exactly what a fresh load would return.
+    """
+    payload = _encode_json(data)
+    try:
+        # Compare bytes, not parsed values: True == 1 == 1.0 in Python
+        if path.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
+
+    _replace_json_file(path, payload)
+    return True
+
+
+# Requested data directory -> usable (probed) data directory
+_DATA_DIR_CACHE: Dict[Path, Path] = {}
+
+
+def _resolve_data_dir(data_dir: Path) -> Path:
+    """Return a writable data directory, probing each path only once per process."""
+    resolved = _DATA_DIR_CACHE.get(data_dir)
+    if resolved is not None:
+        return resolved
+
+    try:
+        data_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Test write permissions by creating and removing a test file
+        test_file = data_dir / "test_permissions.tmp"
+        test_file.touch()
+        test_file.unlink()
+        
+        logger.info(f"✅ Data directory ready: {data_dir}")
+        resolved = data_dir
+        
+    except (PermissionError, FileNotFoundError, OSError):
+        # If we can't create the data directory, use a temporary one
+        import tempfile
+        resolved = Path(tempfile.mkdtemp(prefix="decter_controller_"))
+        logger.warning(f"Could not create data directory, using temporary: {resolved}")
+
+    _DATA_DIR_CACHE[data_dir] = resolved
+    return resolved
+
+
+# Decter path -> (config, utils, DerivAPI, TradingState), or None if not importable
+_DECTER_MODULES_CACHE: Dict[Path, Optional[tuple]] = {}
+
+
+def _import_decter_modules(decter_path: Path) -> Optional[tuple]:
+    """Import the Decter modules for the internal service once per path."""
+    if decter_path in _DECTER_MODULES_CACHE:
+        return _DECTER_MODULES_CACHE[decter_path]
+
+    path_entry = str(decter_path)
+    if path_entry not in sys.path:
+        sys.path.insert(0, path_entry)
+    try:
+        import config as decter_config
+        import utils as decter_utils
+        from deriv_api import DerivAPI
+        from trading_state import TradingState
+        modules = (decter_config, decter_utils, DerivAPI, TradingState)
+    except ImportError as e:
+        logger.warning(f"Could not import Decter modules for internal service: {e}")
+        modules = None
+
+    _DECTER_MODULES_CACHE[decter_path] = modules
+    return modules
+
+
 # Import enhanced modules
 try:
     sys.path.insert(0, str(Path(__file__).parent / "Decter"))
@@ -47,6 +212,32 @@ class DecterMode(Enum):
     RECOVERY = "recovery"
 
 
+# Read-only trading universe and command set
+AVAILABLE_INDICES = (
+    "R_10", "R_25", "R_50", "R_75", "R_100",
+    "1HZ10V", "1HZ25V", "1HZ50V", "1HZ75V", "1HZ100V",
+    "1HZ150V", "1HZ250V"
+)
+AVAILABLE_CURRENCIES = ("XRP", "BTC", "ETH", "LTC", "USDT", "USD")
+VALID_COMMANDS = (
+    "start 001", "start trading", "stop trading", "status",
+    "history", "export", "reset stats", "mode status"
+)
+_VALID_COMMANDS_SET = frozenset(VALID_COMMANDS)
+
+# Telegram notification scaffolding, built once instead of per message
+_TELEGRAM_HEADER = "🤖 **Decter Engine (ACCU)**\n\n"
+_TELEGRAM_TRANSACTION_TEMPLATE = (
+    _TELEGRAM_HEADER
+    + "📊 **Transaction Log**\n"
+    "Type: {type}\n"
+    "Amount: ${amount:.2f}\n"
+    "Result: {result}\n"
+    "Time: {time}\n\n"
+    "{message}"
+)
+
+
 @dataclass
 class DecterConfig:
     """Decter 001 configuration parameters"""
@@ -77,6 +268,10 @@ class DecterStats:
     win_rate: float = 0.0
     daily_profit: float = 0.0
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat field dict; every field is a scalar, so no deep copy is needed"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
 
 class DecterController:
     """
@@ -96,6 +291,9 @@ class DecterController:
         self.status = DecterStatus.OFFLINE
         self.last_heartbeat = None
         self.start_time = None
+        self._start_monotonic: Optional[float] = None
+        # Serializes start/stop/restart; re-entrant because restart calls both
+        self._lock = threading.RLock()
         self.telegram_bot_token = None
         self.telegram_group_id = None
         self.telegram_topic_id = None
@@ -103,51 +301,28 @@ class DecterController:
         # Initialize paths
         self.main_script = self.decter_path / "main.py"
         self.config_file = self.decter_path / "config.py"
-        self.data_dir = self.decter_path / "data"
+        
+        # Ensure data directory exists, falling back to a temporary one
+        self.data_dir = _resolve_data_dir(self.decter_path / "data")
         self.stats_file = self.data_dir / "trading_stats.json"
         self.params_file = self.data_dir / "saved_params.json"
         self.log_file = self.data_dir / "trading_bot.log"
+        self.subprocess_log_file = self.data_dir / "subprocess.log"
         self.engine_logs_file = self.data_dir / "engine_logs.json"
         self.live_logs_file = self.data_dir / "live_logs.json"
-        
-        # Ensure data directory exists with proper error handling
-        try:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Test write permissions by creating and removing a test file
-            test_file = self.data_dir / "test_permissions.tmp"
-            test_file.touch()
-            test_file.unlink()
-            
-            logger.info(f"✅ Data directory ready: {self.data_dir}")
-            
-        except (PermissionError, FileNotFoundError, OSError) as e:
-            # If we can't create the data directory, use a temporary one
-            import tempfile
-            self.data_dir = Path(tempfile.mkdtemp(prefix="decter_controller_"))
-            logger.warning(f"Could not create data directory, using temporary: {self.data_dir}")
-            # Update file paths
-            self.stats_file = self.data_dir / "trading_stats.json"
-            self.params_file = self.data_dir / "saved_params.json"
-            self.log_file = self.data_dir / "trading_bot.log"
-            self.engine_logs_file = self.data_dir / "engine_logs.json"
-            self.live_logs_file = self.data_dir / "live_logs.json"
+        self.telegram_config_file = self.data_dir / "telegram_config.json"
+        self.deriv_config_file = self.data_dir / "deriv_config.json"
+        self.engine_config_file = self.data_dir / "engine_config.json"
+        self.diagnostics_file = self.data_dir / "engine_diagnostics.json"
+        self.transactions_file = self.data_dir / "telegram_transactions.ndjson"
         
         # Try to set up internal service (direct imports)
-        sys.path.insert(0, str(self.decter_path))
-        try:
-            import config as decter_config
-            import utils as decter_utils
-            from deriv_api import DerivAPI
-            from trading_state import TradingState
-            self.decter_config = decter_config
-            self.decter_utils = decter_utils
-            self.DerivAPI = DerivAPI
-            self.TradingState = TradingState
+        decter_modules = _import_decter_modules(self.decter_path)
+        if decter_modules is not None:
+            self.decter_config, self.decter_utils, self.DerivAPI, self.TradingState = decter_modules
             self._internal_service = True
             logger.info(f"🤖 Decter Controller initialized with internal service for path: {decter_path}")
-        except ImportError as e:
-            logger.warning(f"Could not import Decter modules for internal service: {e}")
+        else:
             self._internal_service = False
             logger.info(f"🤖 Decter Controller initialized with subprocess mode for path: {decter_path}")
         
@@ -156,38 +331,45 @@ class DecterController:
 
     def is_running(self) -> bool:
         """Check if Decter 001 process is running"""
-        if self.process is None:
+        proc = self.process
+        if proc is None:
             return False
         
         try:
             # Check if process is still alive
-            return self.process.poll() is None
+            return proc.poll() is None
         except Exception:
             return False
 
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive Decter 001 status"""
         try:
+            proc = self.process
             is_running = self.is_running()
             stats = self.get_stats() if is_running else None
             
-            # Update status based on current state
-            if is_running:
-                if stats and stats.trading_enabled:
-                    self.status = DecterStatus.TRADING
-                else:
-                    self.status = DecterStatus.ONLINE
-            else:
-                self.status = DecterStatus.OFFLINE
+            # Update status based on current state, unless start/stop/restart
+            # is mid-transition and owns it
+            if self._lock.acquire(blocking=False):
+                try:
+                    if is_running:
+                        if stats and stats.trading_enabled:
+                            self.status = DecterStatus.TRADING
+                        else:
+                            self.status = DecterStatus.ONLINE
+                    else:
+                        self.status = DecterStatus.OFFLINE
+                finally:
+                    self._lock.release()
             
             status_info = {
                 "status": self.status.value,
                 "is_running": is_running,
-                "process_id": self.process.pid if self.process else None,
+                "process_id": proc.pid if proc else None,
                 "last_heartbeat": self.last_heartbeat.isoformat() if self.last_heartbeat else None,
                 "uptime_seconds": self._get_uptime(),
                 "start_time": self.start_time.isoformat() if self.start_time else None,
-                "stats": asdict(stats) if stats else None,
+                "stats": stats.to_dict() if stats else None,
                 "config": self._get_current_config(),
                 "recent_logs": self._get_recent_logs(),
                 "available_indices": self._get_available_indices(),
@@ -203,6 +385,7 @@ class DecterController:
                 "is_running": False
             }
 
+    @_with_instance_lock
     def start(self) -> Dict[str, Any]:
         """Start Decter 001 bot"""
         try:
@@ -228,7 +411,7 @@ class DecterController:
             logger.info(f"Main script: {self.main_script}")
             
             # Create log file for subprocess output with proper error handling
-            log_file = self.data_dir / "subprocess.log"
+            log_file = self.subprocess_log_file
             
             try:
                 # Ensure the data directory exists
@@ -262,8 +445,10 @@ class DecterController:
             # Check if it started successfully
             if self.process.poll() is None:
                 self.status = DecterStatus.ONLINE
-                self.last_heartbeat = datetime.now()
-                self.start_time = datetime.now()
+                now = datetime.now()
+                self.last_heartbeat = now
+                self.start_time = now
+                self._start_monotonic = time.monotonic()
                 logger.info(f"✅ Decter 001 started successfully with PID: {self.process.pid}")
                 
                 # Log to JSON
@@ -301,6 +486,7 @@ class DecterController:
                 "status": self.status.value
             }
 
+    @_with_instance_lock
     def stop(self) -> Dict[str, Any]:
         """Stop Decter 001 bot"""
         try:
@@ -328,6 +514,7 @@ class DecterController:
             self.status = DecterStatus.OFFLINE
             self.process = None
             self.start_time = None
+            self._start_monotonic = None
             logger.info("✅ Decter 001 stopped successfully")
             
             # Log to JSON
@@ -352,6 +539,7 @@ class DecterController:
                 "status": self.status.value
             }
 
+    @_with_instance_lock
     def restart(self) -> Dict[str, Any]:
         """Restart Decter 001 bot"""
         logger.info("🔄 Restarting Decter 001 bot...")
@@ -370,12 +558,10 @@ class DecterController:
     def get_stats(self) -> Optional[DecterStats]:
         """Get current trading statistics"""
         try:
-            if not self.stats_file.exists():
+            data = _cached_json(self.stats_file)
+            if data is None:
                 return None
             
-            with open(self.stats_file, 'r') as f:
-                data = json.load(f)
-            
             stats_data = data.get('stats', {})
             
             # Calculate win rate
@@ -421,8 +607,8 @@ class DecterController:
             }
             
             # Save parameters
-            with open(self.params_file, 'w') as f:
-                json.dump(params_data, f, indent=2)
+            with _FILE_LOCK:
+                _write_json_atomic(self.params_file, params_data)
             
             logger.info(f"📝 Parameters updated: {params_data}")
             
@@ -450,12 +636,10 @@ class DecterController:
     def get_trade_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent trade history"""
         try:
-            if not self.stats_file.exists():
+            data = _cached_json(self.stats_file)
+            if data is None:
                 return []
             
-            with open(self.stats_file, 'r') as f:
-                data = json.load(f)
-            
             trade_history = data.get('trade_history', [])
             
             # Return most recent trades
@@ -471,15 +655,10 @@ class DecterController:
             # This is a simplified implementation
             # In a full implementation, you would send commands via Telegram Bot API
             
-            valid_commands = [
-                "start 001", "start trading", "stop trading", "status", 
-                "history", "export", "reset stats", "mode status"
-            ]
-            
-            if command not in valid_commands:
+            if command not in _VALID_COMMANDS_SET:
                 return {
                     "success": False,
-                    "message": f"Invalid command. Valid commands: {', '.join(valid_commands)}"
+                    "message": f"Invalid command. Valid commands: {', '.join(VALID_COMMANDS)}"
                 }
             
             logger.info(f"📱 Simulating Telegram command: {command}")
@@ -499,17 +678,15 @@ class DecterController:
 
     def _get_uptime(self) -> Optional[int]:
         """Get bot uptime in seconds"""
-        if not self.start_time:
+        if self._start_monotonic is None:
             return None
         
-        return int((datetime.now() - self.start_time).total_seconds())
+        return int(time.monotonic() - self._start_monotonic)
 
     def _get_current_config(self) -> Optional[Dict[str, Any]]:
         """Get current configuration"""
         try:
-            if self.params_file.exists():
-                with open(self.params_file, 'r') as f:
-                    return json.load(f)
+            return _cached_json(self.params_file)
         except Exception as e:
             logger.error(f"❌ Error reading config: {e}")
         return None
@@ -523,37 +700,32 @@ class DecterController:
                 return logs
             
             # Fallback to traditional log files
-            if not self.log_file.exists():
-                # Try subprocess log file
-                subprocess_log = self.data_dir / "subprocess.log"
-                if subprocess_log.exists():
-                    try:
-                        with open(subprocess_log, 'r', encoding='utf-8') as f:
-                            all_lines = f.readlines()
-                            return [line.strip() for line in all_lines[-lines:]]
-                    except (PermissionError, OSError) as e:
-                        logger.error(f"Error reading subprocess log: {e}")
-                        return []
-                return []
+            try:
+                with open(self.log_file, 'r', buffering=_LOG_READ_BUFFER) as f:
+                    return [line.strip() for line in deque(f, maxlen=lines)]
+            except FileNotFoundError:
+                pass
             
-            with open(self.log_file, 'r') as f:
-                all_lines = f.readlines()
-                return [line.strip() for line in all_lines[-lines:]]
+            # Try subprocess log file
+            try:
+                with open(self.subprocess_log_file, 'r', encoding='utf-8', buffering=_LOG_READ_BUFFER) as f:
+                    return [line.strip() for line in deque(f, maxlen=lines)]
+            except FileNotFoundError:
+                return []
+            except (PermissionError, OSError) as e:
+                logger.error(f"Error reading subprocess log: {e}")
+                return []
         except Exception as e:
             logger.error(f"❌ Error reading logs: {e}")
             return []
 
     def _get_available_indices(self) -> List[str]:
         """Get available trading indices"""
-        return [
-            "R_10", "R_25", "R_50", "R_75", "R_100",
-            "1HZ10V", "1HZ25V", "1HZ50V", "1HZ75V", "1HZ100V",
-            "1HZ150V", "1HZ250V"
-        ]
+        return list(AVAILABLE_INDICES)
 
     def _get_available_currencies(self) -> List[str]:
         """Get available currencies"""
-        return ["XRP", "BTC", "ETH", "LTC", "USDT", "USD"]
+        return list(AVAILABLE_CURRENCIES)
 
     def set_telegram_config(self, bot_token: str, group_id: str, topic_id: str = None) -> Dict[str, Any]:
         """Set Telegram bot configuration"""
@@ -570,9 +742,9 @@ class DecterController:
             }
             
             # Save config to Decter's data directory
-            config_file = self.data_dir / "telegram_config.json"
-            with open(config_file, 'w') as f:
-                json.dump(telegram_config, f, indent=2)
+            config_file = self.telegram_config_file
+            with _FILE_LOCK:
+                _write_json_atomic(config_file, telegram_config)
             
             logger.info(f"📱 Telegram configuration updated: Group {group_id}, Topic {topic_id}")
             
@@ -600,11 +772,9 @@ class DecterController:
     def get_telegram_config(self) -> Dict[str, Any]:
         """Get current Telegram configuration"""
         try:
-            config_file = self.data_dir / "telegram_config.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    return json.load(f)
-            return {}
+            config_file = self.telegram_config_file
+            # Callers mask the token in place
+            return dict(_cached_json(config_file, {}))
         except Exception as e:
             logger.error(f"❌ Error getting Telegram config: {e}")
             return {}
@@ -618,9 +788,9 @@ class DecterController:
             }
             
             # Save config to Decter's data directory
-            config_file = self.data_dir / "deriv_config.json"
-            with open(config_file, 'w') as f:
-                json.dump(deriv_config, f, indent=2)
+            config_file = self.deriv_config_file
+            with _FILE_LOCK:
+                _write_json_atomic(config_file, deriv_config)
             
             logger.info(f"🔑 Deriv configuration updated: App ID {deriv_app_id[:8]}...")
             
@@ -648,10 +818,9 @@ class DecterController:
     def get_deriv_config(self) -> Dict[str, Any]:
         """Get current Deriv configuration"""
         try:
-            config_file = self.data_dir / "deriv_config.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+            config_file = self.deriv_config_file
+            config = _cached_json(config_file)
+            if config is not None:
                 # Mask sensitive tokens
                 masked_config = {}
                 for k, v in config.items():
@@ -671,7 +840,7 @@ class DecterController:
             engine_config = {
                 # Multi-currency settings
                 "selected_currency": config.get("selected_currency", "XRP"),
-                "supported_currencies": config.get("supported_currencies", ["XRP", "BTC", "ETH", "LTC", "USDT", "USD"]),
+                "supported_currencies": config.get("supported_currencies", list(AVAILABLE_CURRENCIES)),
                 
                 # Continuous Engine parameters
                 "consecutive_wins_threshold": config.get("consecutive_wins_threshold", 10),
@@ -691,9 +860,9 @@ class DecterController:
             }
             
             # Save to engine config file
-            config_file = self.data_dir / "engine_config.json"
-            with open(config_file, 'w') as f:
-                json.dump(engine_config, f, indent=2)
+            config_file = self.engine_config_file
+            with _FILE_LOCK:
+                _write_json_atomic(config_file, engine_config)
             
             logger.info(f"⚙️ Engine configuration updated: Currency {engine_config['selected_currency']}")
             
@@ -721,15 +890,16 @@ class DecterController:
     def get_engine_config(self) -> Dict[str, Any]:
         """Get current engine configuration"""
         try:
-            config_file = self.data_dir / "engine_config.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    return json.load(f)
+            config_file = self.engine_config_file
+            config = _cached_json(config_file)
+            if config is not None:
+                # Callers update the returned dict before saving it back
+                return dict(config)
             
             # Return default configuration
             return {
                 "selected_currency": "XRP",
-                "supported_currencies": ["XRP", "BTC", "ETH", "LTC", "USDT", "USD"],
+                "supported_currencies": list(AVAILABLE_CURRENCIES),
                 "consecutive_wins_threshold": 10,
                 "max_profit_cap": 1000.0,
                 "risk_reduction_factor": 0.7,
@@ -778,14 +948,13 @@ class DecterController:
             }
             
             # Try to load real diagnostics from diagnostic log file
-            diag_file = self.data_dir / "engine_diagnostics.json"
-            if diag_file.exists():
-                with open(diag_file, 'r') as f:
-                    stored_diagnostics = json.load(f)
-                    # Merge with defaults
-                    for category in diagnostics:
-                        if category in stored_diagnostics:
-                            diagnostics[category].update(stored_diagnostics[category])
+            diag_file = self.diagnostics_file
+            stored_diagnostics = _cached_json(diag_file)
+            if stored_diagnostics is not None:
+                # Merge with defaults
+                for category in diagnostics:
+                    if category in stored_diagnostics:
+                        diagnostics[category].update(stored_diagnostics[category])
             
             return diagnostics
             
@@ -793,6 +962,7 @@ class DecterController:
             logger.error(f"❌ Error getting engine diagnostics: {e}")
             return {"error": str(e)}
 
+    @_with_file_lock
     def switch_currency(self, new_currency: str) -> Dict[str, Any]:
         """Switch active trading currency and update API routing"""
         try:
@@ -854,7 +1024,7 @@ class DecterController:
                     "entry_price": transaction_data.get("entry_price", 0.0),
                     "exit_price": transaction_data.get("exit_price", 0.0),
                     "pnl": transaction_data.get("amount", 0.0),
-                    "timestamp": transaction_data.get("timestamp", datetime.now()),
+                    "timestamp": transaction_data.get("timestamp") or datetime.now(),
                     "reason": message,
                     "engine": transaction_data.get("engine", "continuous")
                 }
@@ -892,15 +1062,15 @@ class DecterController:
             
             # Format message with transaction data if provided
             if transaction_data:
-                formatted_message = f"🤖 **Decter Engine (ACCU)**\n\n"
-                formatted_message += f"📊 **Transaction Log**\n"
-                formatted_message += f"Type: {transaction_data.get('type', 'Unknown')}\n"
-                formatted_message += f"Amount: ${transaction_data.get('amount', 0):.2f}\n"
-                formatted_message += f"Result: {transaction_data.get('result', 'Unknown')}\n"
-                formatted_message += f"Time: {transaction_data.get('timestamp', datetime.now().isoformat())}\n\n"
-                formatted_message += f"{message}"
+                formatted_message = _TELEGRAM_TRANSACTION_TEMPLATE.format(
+                    type=transaction_data.get('type', 'Unknown'),
+                    amount=transaction_data.get('amount', 0),
+                    result=transaction_data.get('result', 'Unknown'),
+                    time=transaction_data.get('timestamp') or datetime.now().isoformat(),
+                    message=message
+                )
             else:
-                formatted_message = f"🤖 **Decter Engine (ACCU)**\n\n{message}"
+                formatted_message = _TELEGRAM_HEADER + message
             
             # Send to Telegram (simplified - would use actual Telegram Bot API)
             logger.info(f"📱 Telegram notification: {formatted_message}")
@@ -921,51 +1091,54 @@ class DecterController:
                 "message": f"Error sending notification: {str(e)}"
             }
 
+    @_with_file_lock
     def _log_transaction(self, transaction_data: Dict) -> None:
         """Log transaction data for Telegram notifications"""
         try:
-            log_file = self.data_dir / "telegram_transactions.json"
-            
-            # Load existing logs
-            if log_file.exists():
-                with open(log_file, 'r') as f:
-                    logs = json.load(f)
-            else:
-                logs = []
-            
-            # Add new transaction
+            # Append one line per transaction
             transaction_data['logged_at'] = datetime.now().isoformat()
-            logs.append(transaction_data)
-            
-            # Keep only last 1000 transactions
-            if len(logs) > 1000:
-                logs = logs[-1000:]
-            
-            # Save logs
-            with open(log_file, 'w') as f:
-                json.dump(logs, f, indent=2)
+            with open(self.transactions_file, 'ab') as f:
+                f.write(_encode_json(transaction_data) + b"\n")
+            
+            # Keep only last 1000 transactions, trimming once per 1000 appends
+            appends = _NDJSON_APPENDS_SINCE_TRIM.get(self.transactions_file, 0) + 1
+            if appends >= 1000:
+                self._trim_ndjson_file(self.transactions_file, 1000)
+                appends = 0
+            _NDJSON_APPENDS_SINCE_TRIM[self.transactions_file] = appends
                 
         except Exception as e:
             logger.error(f"❌ Error logging transaction: {e}")
 
+    @_with_file_lock
+    def _trim_ndjson_file(self, file_path: Path, max_entries: int):
+        """Atomically cut an NDJSON file down to its last max_entries lines"""
+        try:
+            with open(file_path, 'rb') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        
+        if len(lines) > max_entries:
+            tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.writelines(lines[-max_entries:])
+            os.replace(tmp_path, file_path)
+
     def _get_logs_from_json(self, lines: int = 10) -> List[str]:
         """Get logs from JSON log files"""
         try:
             logs = []
             
             # Try engine logs first
-            if self.engine_logs_file.exists():
-                with open(self.engine_logs_file, 'r') as f:
-                    engine_logs = json.load(f)
-                    if isinstance(engine_logs, list):
-                        logs.extend(engine_logs[-lines//2:])
+            engine_logs = _cached_json(self.engine_logs_file)
+            if isinstance(engine_logs, list):
+                logs.extend(engine_logs[-lines//2:])
             
             # Then try live logs
-            if self.live_logs_file.exists():
-                with open(self.live_logs_file, 'r') as f:
-                    live_logs = json.load(f)
-                    if isinstance(live_logs, list):
-                        logs.extend(live_logs[-lines//2:])
+            live_logs = _cached_json(self.live_logs_file)
+            if isinstance(live_logs, list):
+                logs.extend(live_logs[-lines//2:])
             
             # Sort by timestamp if available, otherwise return as is
             return logs[-lines:] if logs else []
@@ -993,25 +1166,21 @@ class DecterController:
             self._append_to_json_file(self.live_logs_file, formatted_log)
             
             # Save structured log to engine logs
-            self._append_to_json_file(self.engine_logs_file, log_entry, structured=True)
+            self._append_to_json_file(self.engine_logs_file, log_entry)
             
         except Exception as e:
             logger.error(f"❌ Error logging to JSON: {e}")
 
-    def _append_to_json_file(self, file_path: Path, entry: any, structured: bool = False, max_entries: int = 1000):
+    @_with_file_lock
+    def _append_to_json_file(self, file_path: Path, entry: any, max_entries: int = 1000):
         """Append entry to JSON file with rotation"""
         try:
             # Load existing data
-            if file_path.exists():
-                with open(file_path, 'r') as f:
-                    try:
-                        data = json.load(f)
-                        if not isinstance(data, list):
-                            data = []
-                    except json.JSONDecodeError:
-                        data = []
-            else:
+            try:
+                data = _cached_json(file_path, [])
+            except ValueError:
                 data = []
+            data = list(data) if isinstance(data, list) else []
             
             # Add new entry
             data.append(entry)
@@ -1020,26 +1189,25 @@ class DecterController:
             if len(data) > max_entries:
                 data = data[-max_entries:]
             
-            # Save back to file
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2 if structured else None, default=str)
+            # Save back to file; an append always changes it, so skip the
+            # unchanged-bytes check
+            _replace_json_file(file_path, _encode_json(data))
                 
         except Exception as e:
             logger.error(f"❌ Error appending to JSON file {file_path}: {e}")
 
+    @_with_file_lock
     def clear_json_logs(self) -> Dict[str, Any]:
         """Clear JSON log files"""
         try:
             files_cleared = []
             
             if self.engine_logs_file.exists():
-                with open(self.engine_logs_file, 'w') as f:
-                    json.dump([], f)
+                _write_json_atomic(self.engine_logs_file, [])
                 files_cleared.append("engine_logs.json")
             
             if self.live_logs_file.exists():
-                with open(self.live_logs_file, 'w') as f:
-                    json.dump([], f)
+                _write_json_atomic(self.live_logs_file, [])
                 files_cleared.append("live_logs.json")
             
             self.log_to_json("JSON log files cleared", "INFO", "Controller")
@@ -1057,17 +1225,22 @@ class DecterController:
                 "message": f"Error clearing logs: {str(e)}"
             }
 
+    @_with_file_lock
     def initialize_json_logs(self):
         """Initialize JSON log files with startup messages"""
         try:
             # Create empty log files if they don't exist
             if not self.engine_logs_file.exists():
-                with open(self.engine_logs_file, 'w') as f:
-                    json.dump([], f)
+                _write_json_atomic(self.engine_logs_file, [])
             
             if not self.live_logs_file.exists():
-                with open(self.live_logs_file, 'w') as f:
-                    json.dump([], f)
+                _write_json_atomic(self.live_logs_file, [])
+            
+            # Bound the transaction log left behind by previous runs, once
+            # per process rather than per controller
+            if self.transactions_file not in _NDJSON_APPENDS_SINCE_TRIM:
+                self._trim_ndjson_file(self.transactions_file, 1000)
+                _NDJSON_APPENDS_SINCE_TRIM[self.transactions_file] = 0
             
             # Log initialization
             self.log_to_json(
@@ -54,7 +54,7 @@ class DecterService:
                     BotInstance.exchange == "deriv"  # Decter uses Deriv
                 ).all()
                 
-                logger.info(f"Found {len(decter_instances)} active Decter instances")
+                logger.info("Found %d active Decter instances", len(decter_instances))
                 
                 # Start controllers for new instances
                 for instance in decter_instances:
@@ -93,14 +93,14 @@ class DecterService:
                 for instance_id, controller in self.controllers.items():
                     try:
                         status = controller.get_status()
-                        logger.debug(f"Instance {instance_id} status: {status['status']}")
+                        logger.debug("Instance %s status: %s", instance_id, status['status'])
                         
                         # Log to console for monitoring
                         if status['status'] == 'trading':
                             stats = status.get('stats', {})
-                            logger.info(f"Decter {instance_id} - Trades: {stats.get('total_trades', 0)}, "
-                                      f"Win Rate: {stats.get('win_rate', 0):.1f}%, "
-                                      f"Daily P&L: ${stats.get('daily_profit', 0):.2f}")
+                            logger.info("Decter %s - Trades: %s, Win Rate: %.1f%%, Daily P&L: $%.2f",
+                                        instance_id, stats.get('total_trades', 0),
+                                        stats.get('win_rate', 0), stats.get('daily_profit', 0))
                     except Exception as e:
                         logger.error(f"Error updating status for instance {instance_id}: {e}")
                 
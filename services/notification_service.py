@@ -156,7 +156,7 @@ class NotificationManager:
         
         rate_limit_key = f"{notification.event_type}_{notification.instance_id or 'global'}"
         if self.telegram_service.is_rate_limited(rate_limit_key):
-            logger.debug(f"Notification rate limited: {rate_limit_key}")
+            logger.debug("Notification rate limited: %s", rate_limit_key)
             return True  # Don't consider rate limiting as failure
         
         telegram_message = self._format_telegram_message(notification)
@@ -174,7 +174,7 @@ class NotificationManager:
         """Synchronous version of send_notification"""
         rate_limit_key = f"{notification.event_type}_{notification.instance_id or 'global'}"
         if self.telegram_service.is_rate_limited(rate_limit_key):
-            logger.debug(f"Notification rate limited: {rate_limit_key}")
+            logger.debug("Notification rate limited: %s", rate_limit_key)
             return True
         
         telegram_message = self._format_telegram_message(notification)
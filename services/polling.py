@@ -471,7 +471,7 @@ class ExchangePoller:
                 
                 if is_cloudfront_block:
                     logger.warning(f"⚠️ Method {i+1}/{len(configs_to_try)} failed - CloudFront/Geo blocking: {method_name}")
-                    logger.debug(f"Error details: {str(e)[:200]}")
+                    logger.debug("Error details: %.200s", e)
                     
                     if i < len(configs_to_try) - 1:
                         logger.info(f"🔄 Waiting 2 seconds before next bypass attempt...")
@@ -1351,12 +1351,12 @@ class ExchangePoller:
     async def _send_telegram_notification(self, payload: Dict):
         """Send Telegram notification with beautiful formatting and rate limiting"""
         if not self.telegram_bot:
-            logger.debug(f"No Telegram bot configured for instance {self.instance_id}")
+            logger.debug("No Telegram bot configured for instance %s", self.instance_id)
             return
         
         chat_id = self.instance.telegram_chat_id or settings.default_telegram_chat_id
         if not chat_id:
-            logger.debug(f"No Telegram chat ID configured for instance {self.instance_id}")
+            logger.debug("No Telegram chat ID configured for instance %s", self.instance_id)
             return
         
         try:
@@ -9,12 +9,19 @@ from services.polling import run_poller
 from utils.init_strategy_monitor import initialize_strategy_monitor_system
 import psutil
 
+# Session factory shared across polling iterations so the pool is reused
+_SessionLocal = None
+
 def get_db_session():
     """Create database session for worker with retry logic"""
+    global _SessionLocal
     import time
     max_retries = 3
     retry_delay = 5
     
+    if _SessionLocal is not None:
+        return _SessionLocal()
+    
     for attempt in range(max_retries):
         try:
             database_url = get_database_url()
@@ -33,10 +40,11 @@ def get_db_session():
                 pool_size=10,
                 pool_recycle=3600,
                 pool_pre_ping=True,
+                pool_use_lifo=True,
                 pool_timeout=30
             )
-            SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-            return SessionLocal()
+            _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            return _SessionLocal()
         except Exception as e:
             print(f"Database connection attempt {attempt + 1} failed: {e}")
             if attempt < max_retries - 1:
@@ -8,12 +8,17 @@ from datetime import datetime
 from app.database import BotInstance, get_database_url
 from services.polling import run_poller
 
+# Session factory shared across polling iterations so the pool is reused
+_SessionLocal = None
+
 def get_db_session():
     """Create database session for worker"""
-    database_url = get_database_url()
-    engine = create_engine(database_url)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return SessionLocal()
+    global _SessionLocal
+    if _SessionLocal is None:
+        database_url = get_database_url()
+        engine = create_engine(database_url, pool_pre_ping=True, pool_use_lifo=True)
+        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return _SessionLocal()
 
 async def monitor_instances():
     """Monitor and restart failed instances - standalone version"""